@@ -1,6 +1,5 @@
 #! /usr/bin/env python
 # -*- coding: utf-8 -*-
-__name__ = "TextFileLoader"
 __author__ = "VegaS"
 __date__ = "2019-10-31"
 __version__ = "0.0.3"
@@ -21,6 +20,16 @@ TRANSLATE_DICT = {
 	"NODE_EMPTY": "Node to access has not set!",
 	"NODE_CANNOT_FIND": "Node index to set is too large to access!",
 	"NODE_NO_PARENT": "Current group node is already top!",
+
+	"VALIDATE_READ_FILE": "The file {} can't be read ({})!",
+	"VALIDATE_EMPTY_TOKEN": "The first token of the line is empty!",
+	"VALIDATE_MISSING_VALUE": "Token {} must have a value!",
+	"VALIDATE_UNTERMINATED_STRING": "Unterminated string!",
+	"VALIDATE_UNEXPECTED_BRACKET": "Unexpected '}' outside of any group!",
+	"VALIDATE_UNCLOSED_BRACKET": "{} {} opened at line {} has no closing '}}'!",
+	"VALIDATE_DIAGNOSTIC": "{}:{}: {}",
+	"VALIDATE_SUMMARY": "Checked {} file(s), found {} error(s).",
+	"VALIDATE_NO_FILES": "No files found to check!",
 }
 
 for localeName, localeValue in TRANSLATE_DICT.items():
@@ -300,6 +309,7 @@ class TextFileLoader:
 		:param m_fileLoader: The class parser for data.
 		:param m_globalNode : The global node which is used as reference later.
 		:param m_curNode: The current node which is set by reference or by SetChildNode.
+		:param m_diagnosticList: The diagnostics (fileName, lineNumber, message) collected by Validate.
 		"""
 		self.m_curLineIndex = 0
 		self.m_tokensDict = {}
@@ -312,8 +322,10 @@ class TextFileLoader:
 		self.m_globalNode.SetParent(None)
 
 		self.m_curNode = None
+		self.m_diagnosticList = []
 
 	def __del__(self):
+		del self.m_diagnosticList
 		del self.m_curNode
 		del self.m_globalNode
 		del self.m_fileLoader
@@ -384,6 +396,8 @@ class TextFileLoader:
 					TraceFormat(LOAD_INVALID_LIST_SIZE)
 					return False
 
+				tokenLocalName = tokenList[self.TOKEN_VALUE]
+
 				self.m_curLineIndex += 1
 				while self.m_curLineIndex < self.m_fileLoader.GetLineCount():
 					subTokenList = self.m_fileLoader.SplitLine(self.m_curLineIndex)
@@ -391,9 +405,6 @@ class TextFileLoader:
 						self.m_curLineIndex += 1
 						continue
 
-					tokenLocalName = tokenList[self.TOKEN_VALUE]
-					del tokenList[:]
-
 					if subTokenList[self.TOKEN_TYPE][0] == self.BRACKET_START:
 						self.m_curLineIndex += 1
 						continue
@@ -401,10 +412,7 @@ class TextFileLoader:
 					if subTokenList[self.TOKEN_TYPE][0] == self.BRACKET_END:
 						break
 
-					for subToken in subTokenList:
-						tokenList.append(subToken)
-
-					groupNode.SetToken(tokenLocalName, tokenList)
+					groupNode.SetToken(tokenLocalName, subTokenList)
 					self.m_curLineIndex += 1
 
 			## Token method
@@ -418,6 +426,105 @@ class TextFileLoader:
 			self.m_curLineIndex += 1
 		return True
 
+	def Validate(self, c_szFileName):
+		"""
+			Check the syntax of a specific file without building the group nodes.
+		:returns
+			A bool object, True if the file has no errors, otherwise, it returns “False”.
+			Unlike Load, the scan doesn't stop at the first error, all of them are stored and can be read by GetDiagnosticList.
+		"""
+		self.m_diagnosticList = []
+		self.m_fileName = c_szFileName
+
+		if not IsExistFile(c_szFileName):
+			self.m_diagnosticList.append((c_szFileName, 0, LOAD_INVALID_FILE.format(c_szFileName)))
+			return False
+
+		try:
+			file = open(c_szFileName, 'r')
+			try:
+				file_data = file.readlines()
+			finally:
+				file.close()
+		except (IOError, OSError, UnicodeDecodeError) as error:
+			self.m_diagnosticList.append((c_szFileName, 0, VALIDATE_READ_FILE.format(c_szFileName, error)))
+			return False
+
+		self.m_curLineIndex = 0
+		self.m_fileLoader = FileLoader()
+		self.m_fileLoader.Bind(file_data)
+
+		self.ValidateGroup()
+		return not self.m_diagnosticList
+
+	def ValidateGroup(self):
+		"""
+			Walk the lines with the same grammar as LoadGroup, but without allocating any GroupNode.
+			The recursion of LoadGroup is replaced by a stack of the opened groups/lists (tokenType, name, lineIndex),
+			so the brackets can be checked as well, and an invalid line is recorded instead of stopping the scan.
+		"""
+		blockStack = []
+
+		while self.m_curLineIndex < self.m_fileLoader.GetLineCount():
+			tokenList = self.m_fileLoader.SplitLine(self.m_curLineIndex)
+			if not tokenList:
+				## SplitLine returns None for a comment or for a string which is never closed.
+				if tokenList is None and not self.m_fileLoader.GetLineString(self.m_curLineIndex).startswith(FileLoader.DELIMITER_COMMENT_END):
+					self.AppendDiagnostic(VALIDATE_UNTERMINATED_STRING)
+
+				self.m_curLineIndex += 1
+				continue
+
+			## LoadGroup can't read the first character of an empty token.
+			if not tokenList[self.TOKEN_TYPE]:
+				self.AppendDiagnostic(VALIDATE_EMPTY_TOKEN)
+				self.m_curLineIndex += 1
+				continue
+
+			if tokenList[self.TOKEN_TYPE][0] == self.BRACKET_START:
+				self.m_curLineIndex += 1
+				continue
+
+			if tokenList[self.TOKEN_TYPE][0] == self.BRACKET_END:
+				if blockStack:
+					blockStack.pop()
+				else:
+					self.AppendDiagnostic(VALIDATE_UNEXPECTED_BRACKET)
+
+				self.m_curLineIndex += 1
+				continue
+
+			## List values
+			if blockStack and blockStack[-1][0] == self.TOKEN_TYPE_LIST:
+				self.m_curLineIndex += 1
+				continue
+
+			## Group or list method
+			if tokenList[self.TOKEN_TYPE] in (self.TOKEN_TYPE_GROUP, self.TOKEN_TYPE_LIST):
+				if len(tokenList) != self.TOKEN_LIMIT:
+					self.AppendDiagnostic(LOAD_INVALID_GROUP_SIZE if tokenList[self.TOKEN_TYPE] == self.TOKEN_TYPE_GROUP else LOAD_INVALID_LIST_SIZE)
+
+				blockStack.append((tokenList[self.TOKEN_TYPE], ' '.join(tokenList[self.TOKEN_VALUE:]) or "<unnamed>", self.m_curLineIndex))
+
+			## Token method
+			elif len(tokenList) == 1:
+				self.AppendDiagnostic(VALIDATE_MISSING_VALUE.format(tokenList[self.TOKEN_TYPE]))
+
+			self.m_curLineIndex += 1
+
+		for tokenType, tokenName, lineIndex in blockStack:
+			self.m_diagnosticList.append((self.GetFileName(), lineIndex + 1, VALIDATE_UNCLOSED_BRACKET.format(tokenType, tokenName, lineIndex + 1)))
+
+		self.m_diagnosticList.sort(key=lambda diagnostic: diagnostic[1])
+
+	def AppendDiagnostic(self, message):
+		""" Store a new diagnostic for the current line, the line number is 1-based. """
+		self.m_diagnosticList.append((self.GetFileName(), self.m_curLineIndex + 1, message))
+
+	def GetDiagnosticList(self):
+		""" Returns a list object with all of the diagnostics (fileName, lineNumber, message) collected by the last Validate call. """
+		return self.m_diagnosticList
+
 	def SetTop(self):
 		""" Set the current node as top by global node reference class. """
 		self.m_curNode = self.m_globalNode
@@ -608,7 +715,79 @@ class TextFileLoader:
 		"""
 		pass
 
+#################################################
+## Lint
+#################################################
+def ValidateFile(c_szFileName):
+	""" Returns a list object with the diagnostics of a specific file, it's a module function so it can be sent to the worker processes. """
+	loader = TextFileLoader()
+	loader.Validate(c_szFileName)
+	return loader.GetDiagnosticList()
+
+def GetLintFileList(pathList, extensionList):
+	""" Returns a sorted list object with the unique files to check, the directories are walked recursive and filtered by extension. """
+	extensionList = tuple(extension if extension.startswith('.') else '.' + extension for extension in extensionList)
+
+	fileSet = set()
+	for path in pathList:
+		if not os.path.isdir(path):
+			fileSet.add(os.path.normpath(path))
+			continue
+
+		for root, dirNames, fileNames in os.walk(path):
+			for fileName in fileNames:
+				if os.path.splitext(fileName)[1] in extensionList:
+					fileSet.add(os.path.normpath(os.path.join(root, fileName)))
+	return sorted(fileSet)
+
+def Lint(pathList, extensionList=(".txt",), jobCount=None):
+	"""
+		Validate all of the files from the path list in parallel.
+	:returns
+		A tuple object with the count of checked files and the list of diagnostics, ordered by file name.
+	"""
+	import multiprocessing
+
+	fileList = GetLintFileList(pathList, extensionList)
+	jobCount = min(jobCount or multiprocessing.cpu_count(), len(fileList))
+
+	if jobCount <= 1:
+		resultList = [ValidateFile(fileName) for fileName in fileList]
+	else:
+		pool = multiprocessing.Pool(jobCount)
+		try:
+			resultList = pool.map(ValidateFile, fileList, max(1, len(fileList) // (jobCount * 4)))
+		finally:
+			pool.close()
+			pool.join()
+
+	return len(fileList), [diagnostic for diagnosticList in resultList for diagnostic in diagnosticList]
+
+def main(argv=None):
+	""" Command line entry point of Lint, returns 0 if all of the files are valid, otherwise, 1 (also when no files are found). """
+	import argparse
+
+	parser = argparse.ArgumentParser(description="Check the syntax of text files without loading them.")
+	parser.add_argument("paths", nargs='+', help="Files or directories to check.")
+	parser.add_argument("-e", "--ext", action="append", dest="extensionList", help="File extension to check inside of directories, the leading dot is optional (default: .txt).")
+	parser.add_argument("-j", "--jobs", type=int, default=None, help="Number of worker processes (default: cpu count).")
+	args = parser.parse_args(argv)
+
+	fileCount, diagnosticList = Lint(args.paths, tuple(args.extensionList or (".txt",)), args.jobs)
+	for diagnostic in diagnosticList:
+		TraceFormat(VALIDATE_DIAGNOSTIC.format(*diagnostic))
+
+	if not fileCount:
+		TraceFormat(VALIDATE_NO_FILES)
+		return 1
+
+	TraceFormat(VALIDATE_SUMMARY.format(fileCount, len(diagnosticList)))
+	return 1 if diagnosticList else 0
+
 if __name__ == "__main__":
+	if len(sys.argv) > 1:
+		sys.exit(main(sys.argv[1:]))
+
 	def LoadFileTest(c_szFileName):
 		# from TextFileLoader import TextFileLoader
 		loader = TextFileLoader()
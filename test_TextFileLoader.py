@@ -0,0 +1,169 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+import io
+import locale
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+import TextFileLoader as tfl
+
+BENCHMARK_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmark.txt")
+
+
+class ValidateTest(unittest.TestCase):
+	def setUp(self):
+		self.dirName = tempfile.mkdtemp()
+
+	def tearDown(self):
+		shutil.rmtree(self.dirName)
+
+	def WriteFile(self, fileName, data, mode='w'):
+		filePath = os.path.join(self.dirName, fileName)
+		file = open(filePath, mode)
+		file.write(data)
+		file.close()
+		return filePath
+
+	def Validate(self, data):
+		filePath = self.WriteFile("test.txt", data)
+		return filePath, tfl.ValidateFile(filePath)
+
+	def testValidFile(self):
+		loader = tfl.TextFileLoader()
+		self.assertTrue(loader.Validate(BENCHMARK_FILE))
+		self.assertEqual(loader.GetDiagnosticList(), [])
+
+	def testListValuesAndComments(self):
+		filePath, diagnosticList = self.Validate('#--# "comment\nList L\n{\n\tGroup 1 2\n\tA\n}\n')
+		self.assertEqual(diagnosticList, [])
+
+		loader = tfl.TextFileLoader()
+		self.assertTrue(loader.Load(filePath))
+
+	def testLoadAndValidateAgreeOnList(self):
+		filePath, diagnosticList = self.Validate("List L\n{\n\tA B\n}\nC 1\n")
+		self.assertEqual(diagnosticList, [])
+
+		loader = tfl.TextFileLoader()
+		self.assertTrue(loader.Load(filePath))
+
+		loader.SetTop()
+		tokenList = []
+		self.assertTrue(loader.GetTokenList("L", tokenList))
+		self.assertEqual(tokenList, [["A", "B"]])
+		self.assertEqual(loader.GetTokenString("C"), "1")
+
+	def testMissingFile(self):
+		filePath = os.path.join(self.dirName, "missing.txt")
+		self.assertEqual(tfl.ValidateFile(filePath), [(filePath, 0, tfl.LOAD_INVALID_FILE.format(filePath))])
+
+	@unittest.skipIf(locale.getpreferredencoding(False).lower().replace('-', '') != "utf8", "needs an utf-8 locale")
+	def testUnreadableFile(self):
+		filePath = self.WriteFile("test.txt", b'KEY "caf\xe9"\n', 'wb')
+		diagnosticList = tfl.ValidateFile(filePath)
+		self.assertEqual(len(diagnosticList), 1)
+		self.assertEqual(diagnosticList[0][:2], (filePath, 0))
+		self.assertTrue(diagnosticList[0][2].startswith("The file {} can't be read (".format(filePath)))
+
+	def testMissingValue(self):
+		filePath, diagnosticList = self.Validate("A 1\nB\n")
+		self.assertEqual(diagnosticList, [(filePath, 2, "Token B must have a value!")])
+
+	def testInvalidGroupSize(self):
+		filePath, diagnosticList = self.Validate("Group\n{\n}\n")
+		self.assertEqual(diagnosticList, [(filePath, 1, tfl.LOAD_INVALID_GROUP_SIZE)])
+
+	def testUnnamedUnclosedBracket(self):
+		filePath, diagnosticList = self.Validate("Group\n{\n")
+		self.assertEqual(diagnosticList, [
+			(filePath, 1, tfl.LOAD_INVALID_GROUP_SIZE),
+			(filePath, 1, "Group <unnamed> opened at line 1 has no closing '}'!"),
+		])
+
+	def testInvalidListSize(self):
+		filePath, diagnosticList = self.Validate("List a b\n{\n}\n")
+		self.assertEqual(diagnosticList, [(filePath, 1, tfl.LOAD_INVALID_LIST_SIZE)])
+
+	def testUnterminatedString(self):
+		filePath, diagnosticList = self.Validate('A 1\nKEY a"b "c\nX "oops\n')
+		self.assertEqual(diagnosticList, [(filePath, 2, "Unterminated string!"), (filePath, 3, "Unterminated string!")])
+
+	def testEmptyToken(self):
+		filePath, diagnosticList = self.Validate('"" x\n')
+		self.assertEqual(diagnosticList, [(filePath, 1, "The first token of the line is empty!")])
+
+	def testUnexpectedBracket(self):
+		filePath, diagnosticList = self.Validate("A 1\n}\n")
+		self.assertEqual(diagnosticList, [(filePath, 2, "Unexpected '}' outside of any group!")])
+
+	def testUnclosedBracket(self):
+		filePath, diagnosticList = self.Validate("Group G\n{\n\tA 1\n")
+		self.assertEqual(diagnosticList, [(filePath, 1, "Group G opened at line 1 has no closing '}'!")])
+
+	def testAllDiagnostics(self):
+		filePath, diagnosticList = self.Validate("A\nGroup\n{\n}\n}\nGroup G\n{\n\tB\n")
+		self.assertEqual(diagnosticList, [
+			(filePath, 1, "Token A must have a value!"),
+			(filePath, 2, tfl.LOAD_INVALID_GROUP_SIZE),
+			(filePath, 5, "Unexpected '}' outside of any group!"),
+			(filePath, 6, "Group G opened at line 6 has no closing '}'!"),
+			(filePath, 8, "Token B must have a value!"),
+		])
+
+
+class LintTest(unittest.TestCase):
+	def setUp(self):
+		self.dirName = tempfile.mkdtemp()
+		shutil.copy(BENCHMARK_FILE, os.path.join(self.dirName, "a.txt"))
+		shutil.copy(BENCHMARK_FILE, os.path.join(self.dirName, "b.txt"))
+
+	def tearDown(self):
+		shutil.rmtree(self.dirName)
+
+	def AddInvalidFile(self):
+		filePath = os.path.join(self.dirName, "c.txt")
+		file = open(filePath, 'w')
+		file.write("A\n")
+		file.close()
+		return filePath
+
+	def Main(self, argv):
+		""" Returns the exit status of main and the lines written to stdout. """
+		stdout = sys.stdout
+		sys.stdout = io.StringIO()
+		try:
+			status = tfl.main(argv)
+			output = sys.stdout.getvalue()
+		finally:
+			sys.stdout = stdout
+		return status, output.splitlines()
+
+	def testValidDirectory(self):
+		for jobs in ("-j1", "-j2"):
+			self.assertEqual(self.Main([jobs, self.dirName]), (0, ["Checked 2 file(s), found 0 error(s)."]))
+
+	def testInvalidDirectory(self):
+		filePath = self.AddInvalidFile()
+		for jobs in ("-j1", "-j2"):
+			self.assertEqual(self.Main([jobs, self.dirName]), (1, [
+				"{}:1: Token A must have a value!".format(filePath),
+				"Checked 3 file(s), found 1 error(s).",
+			]))
+		self.assertEqual(tfl.Lint([self.dirName], jobCount=2), (3, [(filePath, 1, "Token A must have a value!")]))
+
+	def testExtensionWithoutDot(self):
+		self.assertEqual(tfl.Lint([self.dirName], ("txt",), 1)[0], 2)
+
+	def testNoFiles(self):
+		self.assertEqual(self.Main(["-e", ".cfg", self.dirName]), (1, ["No files found to check!"]))
+
+	def testDuplicateFile(self):
+		filePath = self.AddInvalidFile()
+		self.assertEqual(tfl.Lint([self.dirName, filePath], jobCount=1), (3, [(filePath, 1, "Token A must have a value!")]))
+
+
+if __name__ == "__main__":
+	unittest.main()